@@ -0,0 +1,31 @@
+"""
+PtoF - PPTX to Figures - Worker Process Entry Point
+
+Kept free of GUI imports so that worker processes started with the spawn
+method (Windows) do not load customtkinter/tkinterdnd2/Tk.
+"""
+
+from .core import process_pptx
+
+
+def process_pptx_worker(file_idx, pptx_file, kwargs, progress_queue, cancel_event, convert_lock):
+    """
+    Process one PPTX file in a worker process, relaying progress to the parent.
+
+    Args:
+        file_idx: Index of the file in the parent's file list
+        pptx_file: Input PPTX file path
+        kwargs: Keyword arguments for process_pptx()
+        progress_queue: Queue receiving (file_idx, message, current, total) tuples
+        cancel_event: Event set by the parent to cancel processing
+        convert_lock: Lock serializing PDF conversion between workers
+
+    Returns:
+        list: List of output files
+    """
+    def progress_callback(msg, current, total):
+        progress_queue.put((file_idx, msg, current, total))
+        return not cancel_event.is_set()
+
+    return process_pptx(pptx_file, progress_callback=progress_callback,
+                        convert_lock=convert_lock, **kwargs)
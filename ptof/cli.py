@@ -5,11 +5,21 @@ Module providing command-line interface.
 """
 
 import argparse
+import contextlib
 import glob
 import os
+import shutil
 import sys
 
-from .core import process_pptx, parse_color
+from .core import (
+    process_pptx,
+    parse_color,
+    prepare_pptx,
+    confirm_overwrite,
+    convert_pptx_to_pdf_batch,
+    make_temp_dir,
+    PowerPointSession,
+)
 
 
 def main():
@@ -43,6 +53,25 @@ def main():
         default=300,
         help='Resolution for PNG output (default: 300)'
     )
+    parser.add_argument(
+        '--png-compress',
+        type=int,
+        choices=range(10),
+        metavar='0-9',
+        help='PNG compression level (lower is faster; requires Pillow, default: MuPDF encoder)'
+    )
+    parser.add_argument(
+        '--raster-pdf',
+        action='store_true',
+        help='Rasterize PDF output at --dpi instead of keeping vector content'
+    )
+    parser.add_argument(
+        '--clip-workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Processes used to clip regions (default: 1; more helps only with many high-DPI PNGs)'
+    )
     parser.add_argument(
         '--margin',
         type=float,
@@ -69,6 +98,16 @@ def main():
         action='store_true',
         help='Include slide background in output'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always rescan input files instead of reusing the scan cache in the output directory'
+    )
+    parser.add_argument(
+        '--libreoffice',
+        action='store_true',
+        help='Convert all files with a single LibreOffice run (default outside Windows if available)'
+    )
 
     args = parser.parse_args()
 
@@ -103,28 +142,97 @@ def main():
         print(f"Error: {e}")
         sys.exit(1)
 
+    # Convert all inputs with one LibreOffice run (PowerPoint stays the default on Windows)
+    use_libreoffice = args.libreoffice or (sys.platform != 'win32' and shutil.which('soffice'))
+    pre_converted = {}
+    confirmed_files = set()
+    skipped_files = set()  # Failed to prepare, or overwrite declined
+    batch_dir = None
+
+    if use_libreoffice and not args.dry_run:
+        batch_dir = make_temp_dir()
+        prepared_files = {}
+        for i, pptx_file in enumerate(input_files):
+            prepared_path = os.path.join(batch_dir, f'ptof_{i}.pptx')
+            try:
+                # The scan is cached in the output directory for process_pptx() below
+                clip_info = prepare_pptx(pptx_file, prepared_path, marker_color, args.include_background,
+                                         output_dir=args.output, use_cache=not args.no_cache)
+            except Exception as e:
+                print(f"Error processing {pptx_file}: {e}")
+                if len(input_files) == 1:
+                    shutil.rmtree(batch_dir, ignore_errors=True)
+                    sys.exit(1)
+                skipped_files.add(pptx_file)
+                continue
+
+            if not clip_info:
+                continue
+
+            # Ask before converting, so declined files are not converted for nothing
+            if args.no_overwrite:
+                if not confirm_overwrite(clip_info, args.output):
+                    skipped_files.add(pptx_file)
+                    continue
+                confirmed_files.add(pptx_file)
+
+            prepared_files[pptx_file] = prepared_path
+
+        if prepared_files:
+            try:
+                if not args.quiet:
+                    print(f"Converting {len(prepared_files)} file(s) to PDF with LibreOffice...")
+                pdf_paths = convert_pptx_to_pdf_batch(list(prepared_files.values()), batch_dir, args.embed_fonts)
+                pre_converted = dict(zip(prepared_files, pdf_paths))
+
+            except Exception as e:
+                print(f"Warning: LibreOffice batch conversion failed: {e}")
+
     all_output_files = []
 
-    for pptx_file in input_files:
-        try:
-            output_files = process_pptx(
-                pptx_file,
-                args.output,
-                args.embed_fonts,
-                marker_color,
-                args.dpi,
-                args.margin,
-                args.dry_run,
-                args.quiet,
-                args.no_overwrite,
-                include_background=args.include_background
-            )
-            all_output_files.extend(output_files)
-
-        except Exception as e:
-            print(f"Error processing {pptx_file}: {e}")
-            if len(input_files) == 1:
-                sys.exit(1)
+    # Share one PowerPoint connection across all files that need conversion
+    needs_powerpoint = (not args.dry_run and sys.platform == 'win32' and
+                        any(f not in pre_converted and f not in skipped_files for f in input_files))
+    session = PowerPointSession() if needs_powerpoint else contextlib.nullcontext()
+
+    try:
+        with session as powerpoint_app:
+            for pptx_file in input_files:
+                if pptx_file in skipped_files:
+                    continue
+                try:
+                    output_files = process_pptx(
+                        pptx_file,
+                        args.output,
+                        args.embed_fonts,
+                        marker_color,
+                        args.dpi,
+                        args.margin,
+                        args.dry_run,
+                        args.quiet,
+                        args.no_overwrite and pptx_file not in confirmed_files,
+                        include_background=args.include_background,
+                        pre_converted_pdf=pre_converted.get(pptx_file),
+                        powerpoint_app=powerpoint_app,
+                        raster_pdf=args.raster_pdf,
+                        use_cache=not args.no_cache,
+                        png_compress=args.png_compress,
+                        clip_workers=args.clip_workers
+                    )
+                    all_output_files.extend(output_files)
+
+                except Exception as e:
+                    print(f"Error processing {pptx_file}: {e}")
+                    if len(input_files) == 1:
+                        sys.exit(1)
+
+    except Exception as e:
+        print(f"Error: Failed to start PowerPoint: {e}")
+        sys.exit(1)
+
+    finally:
+        if batch_dir:
+            shutil.rmtree(batch_dir, ignore_errors=True)
 
     if not args.quiet:
         if all_output_files:
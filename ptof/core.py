@@ -4,16 +4,23 @@ PtoF - PPTX to Figures - Core Engine
 Module providing core processing logic.
 """
 
+import contextlib
+import io
+import json
 import os
 import re
 import shutil
+import subprocess
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from pptx import Presentation
 from pptx.util import Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml.ns import namespaces, qn
 
 
 # Color name to RGB value mapping
@@ -32,6 +39,71 @@ COLOR_NAMES = {
     'white': (255, 255, 255),
 }
 
+# Valid characters of a (lowercase) HEX color
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+# Resolution of matching distances (0.01 pt in EMU); closer candidates count as ties
+_MATCH_DISTANCE_UNIT = 127
+
+# Per-pair tie-break terms added to matching costs are in [0, 2**_TIE_BREAK_BITS)
+_TIE_BREAK_BITS = 20
+_TIE_BREAK_RANGE = 1 << _TIE_BREAK_BITS
+
+# Constants of the SplitMix64 generator (Steele, Lea and Flood, OOPSLA 2014; also
+# java.util.SplittableRandom): the golden-ratio increment 2**64 / phi and the two
+# multipliers of its output mixing function
+_SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15
+_SPLITMIX64_MUL1 = 0xBF58476D1CE4E5B9
+_SPLITMIX64_MUL2 = 0x94D049BB133111EB
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Scan cache file (in the output directory)
+SCAN_CACHE_FILENAME = '.ptof_cache.json'
+
+# Scan cache format version; bump whenever detection or matching changes so
+# plans cached by older code are rescanned
+_SCAN_CACHE_VERSION = 4
+
+# Age in seconds after which a scan cache lock file is considered abandoned
+_SCAN_CACHE_STALE_LOCK = 30
+
+# Buffer size for reading/writing PPTX files (ZIP archives)
+_PPTX_IO_BUFFER_SIZE = 1 << 18
+
+# One 11-bit lane per color channel for the SWAR color check (see _color_bounds)
+_LANE_ONES = (1 << 22) | (1 << 11) | 1
+_LANE_TOPS = _LANE_ONES << 10
+
+# Pattern for "filename=xxx.pdf" text in text boxes
+_FILENAME_RE = re.compile(r'filename\s*=\s*(\S+\.(?:pdf|png|svg))', re.IGNORECASE)
+
+# Slide XML lookups used to pre-filter shapes without python-pptx wrappers
+_NSMAP = namespaces('a', 'p')
+_LINE_SRGB_PATH = './p:spPr/a:ln/a:solidFill/a:srgbClr'
+_SP_TAG = qn('p:sp')
+_GROUP_TAG = qn('p:grpSp')
+_TEXT_TAG = qn('a:t')
+
+# Shape elements that can have a line (p:spPr/a:ln)
+_LINE_SHAPE_TAGS = frozenset((qn('p:sp'), qn('p:cxnSp'), qn('p:pic')))
+
+
+def make_temp_dir():
+    """
+    Create a temporary working directory.
+
+    The location can be set with the PTOF_TMPDIR environment variable.
+    Otherwise memory-backed /dev/shm is used where available, falling back
+    to the system default temp directory.
+
+    Returns:
+        str: Path of the created directory
+    """
+    root = os.environ.get('PTOF_TMPDIR')
+    if not root and os.path.isdir('/dev/shm'):
+        root = '/dev/shm'
+    return tempfile.mkdtemp(dir=root or None)
+
 
 def parse_color(color_str):
     """
@@ -52,25 +124,14 @@ def parse_color(color_str):
     if color_str in COLOR_NAMES:
         return COLOR_NAMES[color_str]
 
-    # HEX format
+    # HEX format (#RRGGBB or #RGB)
     if color_str.startswith('#'):
         hex_str = color_str[1:]
-        if len(hex_str) == 6:
-            try:
-                r = int(hex_str[0:2], 16)
-                g = int(hex_str[2:4], 16)
-                b = int(hex_str[4:6], 16)
-                return (r, g, b)
-            except ValueError:
-                pass
-        elif len(hex_str) == 3:
-            try:
-                r = int(hex_str[0] * 2, 16)
-                g = int(hex_str[1] * 2, 16)
-                b = int(hex_str[2] * 2, 16)
-                return (r, g, b)
-            except ValueError:
-                pass
+        if len(hex_str) == 3:
+            hex_str = hex_str[0] * 2 + hex_str[1] * 2 + hex_str[2] * 2
+        if len(hex_str) == 6 and _HEX_DIGITS.issuperset(hex_str):
+            value = int(hex_str, 16)
+            return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
 
     available = ', '.join(COLOR_NAMES.keys())
     raise ValueError(f"Invalid color: '{color_str}'. Use color name ({available}) or HEX (#RRGGBB)")
@@ -88,19 +149,87 @@ def is_matching_color(color, target_rgb, tolerance=30):
     Returns:
         bool: True if the color is close to the target
     """
+    return _is_color_in_bounds(color, _color_bounds(target_rgb, tolerance))
+
+
+def _spread_rgb(rgb_int):
+    """
+    Move each channel of a 0xRRGGBB value into its own 11-bit lane.
+
+    Args:
+        rgb_int: Packed 24-bit color
+
+    Returns:
+        int: Spread color (R in bits 22-29, G in bits 11-18, B in bits 0-7)
+    """
+    return ((rgb_int & 0xFF0000) << 6) | ((rgb_int & 0xFF00) << 3) | (rgb_int & 0xFF)
+
+
+def _color_bounds(target_rgb, tolerance=30):
+    """
+    Precompute constants for matching colors against a target color.
+
+    All three channels are checked at once with integer arithmetic (SWAR):
+    adding the first constant to a spread color sets the top bit of a lane
+    only if channel >= target - tolerance, and adding the second sets it
+    only if channel > target + tolerance.
+
+    Args:
+        target_rgb: Target color (R, G, B) tuple
+        tolerance: Tolerance (allowed difference for each channel, up to 255)
+
+    Returns:
+        tuple: (low_offset, high_offset)
+    """
+    tolerance = min(tolerance, 255)
+    r, g, b = target_rgb
+    base = _LANE_ONES * (256 + tolerance) - _spread_rgb((r << 16) | (g << 8) | b)
+    return (base + _LANE_ONES * 768,
+            base + _LANE_ONES * (767 - 2 * tolerance))
+
+
+def _is_rgb_int_in_bounds(rgb_int, bounds):
+    """
+    Check a packed 0xRRGGBB color against bounds from _color_bounds().
+
+    Args:
+        rgb_int: Packed 24-bit color
+        bounds: Result of _color_bounds()
+
+    Returns:
+        bool: True if every channel is within tolerance
+    """
+    spread = _spread_rgb(rgb_int)
+    low_offset, high_offset = bounds
+    return (((spread + low_offset) & _LANE_TOPS) == _LANE_TOPS and
+            not (spread + high_offset) & _LANE_TOPS)
+
+
+def _is_color_in_bounds(color, bounds):
+    """
+    Check a color against bounds from _color_bounds().
+
+    Args:
+        color: RGBColor object or None
+        bounds: Result of _color_bounds()
+
+    Returns:
+        bool: True if every channel is within tolerance
+    """
     if color is None:
         return False
 
     try:
-        r = color[0] if hasattr(color, '__getitem__') else color.red
-        g = color[1] if hasattr(color, '__getitem__') else color.green
-        b = color[2] if hasattr(color, '__getitem__') else color.blue
-    except (TypeError, AttributeError):
+        r, g, b = color  # RGBColor is a tuple subclass
+    except TypeError:
+        try:
+            r, g, b = color.red, color.green, color.blue
+        except AttributeError:
+            return False
+    except ValueError:
         return False
 
-    return (abs(r - target_rgb[0]) <= tolerance and
-            abs(g - target_rgb[1]) <= tolerance and
-            abs(b - target_rgb[2]) <= tolerance)
+    return _is_rgb_int_in_bounds((r << 16) | (g << 8) | b, bounds)
 
 
 def get_shape_line_color(shape):
@@ -113,6 +242,10 @@ def get_shape_line_color(shape):
     Returns:
         RGBColor or None
     """
+    # Groups, tables, charts etc. have no line; skip them without raising
+    if shape._element.tag not in _LINE_SHAPE_TAGS:
+        return None
+
     try:
         line = shape.line
         if line.fill.type is not None:
@@ -135,12 +268,13 @@ def find_marker_rectangles(slide, target_rgb):
         list: List of rectangle info [{left, top, width, height, shape}] (in EMU)
     """
     rectangles = []
+    bounds = _color_bounds(target_rgb)
 
     for shape in slide.shapes:
         # Get line color
         line_color = get_shape_line_color(shape)
 
-        if is_matching_color(line_color, target_rgb):
+        if _is_color_in_bounds(line_color, bounds):
             rect = {
                 'left': shape.left,
                 'top': shape.top,
@@ -164,13 +298,16 @@ def find_filename_textboxes(slide):
         list: List of filename info [{filename, left, top, shape}]
     """
     filenames = []
-    pattern = re.compile(r'filename\s*=\s*(\S+\.(?:pdf|png|svg))', re.IGNORECASE)
+    pattern = _FILENAME_RE
 
     for shape in slide.shapes:
         if not shape.has_text_frame:
             continue
 
         text = shape.text_frame.text
+        if 'filename' not in text.lower():
+            continue
+
         match = pattern.search(text)
 
         if match:
@@ -184,6 +321,138 @@ def find_filename_textboxes(slide):
     return filenames
 
 
+def _scan_slide_shapes(slide, target_rgb):
+    """
+    Detect marker rectangles and filename text boxes in a single pass.
+
+    Equivalent to calling find_marker_rectangles() and
+    find_filename_textboxes(), but works on the slide XML directly: each
+    shape element is visited once, and a python-pptx Shape object is only
+    created for shapes that turn out to be markers or filename boxes.
+    Shapes inside groups are also detected (positions in slide coordinates).
+
+    Args:
+        slide: python-pptx Slide object
+        target_rgb: Target color (R, G, B) tuple
+
+    Returns:
+        tuple: (rectangles, filenames)
+    """
+    rectangles = []
+    filenames = []
+    pattern = _FILENAME_RE
+    bounds = _color_bounds(target_rgb)
+    shapes = slide.shapes
+
+    for element, transform in _iter_shape_elements(shapes._spTree):
+        # Line color (python-pptx only reports explicit solid sRGB line colors)
+        srgb = element.find(_LINE_SRGB_PATH, _NSMAP)
+        is_marker = srgb is not None and _is_rgb_int_in_bounds(int(srgb.get('val'), 16), bounds)
+
+        shape = None
+        match = None
+        if element.tag == _SP_TAG:
+            # Cheap check on the raw text runs before building the text frame
+            raw_text = ''.join(t.text or '' for t in element.iter(_TEXT_TAG))
+            if 'filename' in raw_text.lower():
+                shape = shapes._shape_factory(element)
+                match = pattern.search(shape.text_frame.text)
+
+        if not is_marker and not match:
+            continue
+
+        # Use the slide's factory so placeholders inherit their layout position
+        if shape is None:
+            shape = shapes._shape_factory(element)
+        left, top, width, height = shape.left, shape.top, shape.width, shape.height
+        if transform is not None:
+            scale_x, scale_y, offset_x, offset_y = transform
+            left = round(offset_x + left * scale_x)
+            top = round(offset_y + top * scale_y)
+            width = round(width * scale_x)
+            height = round(height * scale_y)
+
+        if is_marker:
+            rectangles.append({
+                'left': left,
+                'top': top,
+                'width': width,
+                'height': height,
+                'shape': shape,
+            })
+
+        if match:
+            filenames.append({
+                'filename': match.group(1),
+                'left': left,
+                'top': top,
+                'shape': shape,
+            })
+
+    return rectangles, filenames
+
+
+def _iter_shape_elements(group, transform=None):
+    """
+    Iterate over the shape elements of a shape tree, descending into groups.
+
+    Args:
+        group: p:spTree or p:grpSp element
+        transform: Transform of group's child coordinates to slide coordinates
+                   (scale_x, scale_y, offset_x, offset_y), or None for identity
+
+    Yields:
+        tuple: (element, transform) for each non-group shape element
+    """
+    for element in group.iter_shape_elms():
+        if element.tag == _GROUP_TAG:
+            yield from _iter_shape_elements(element, _group_transform(element, transform))
+        else:
+            yield element, transform
+
+
+def _group_transform(group, parent_transform=None):
+    """
+    Get the transform from a group's child coordinates to slide coordinates.
+
+    Args:
+        group: p:grpSp element
+        parent_transform: Transform of the enclosing group (None for identity)
+
+    Returns:
+        tuple: (scale_x, scale_y, offset_x, offset_y), or None for identity
+    """
+    xfrm = group.find('./p:grpSpPr/a:xfrm', _NSMAP)
+    if xfrm is None:
+        return parent_transform
+
+    off = xfrm.find('a:off', _NSMAP)
+    ext = xfrm.find('a:ext', _NSMAP)
+    ch_off = xfrm.find('a:chOff', _NSMAP)
+    ch_ext = xfrm.find('a:chExt', _NSMAP)
+    if off is None or ext is None or ch_off is None or ch_ext is None:
+        return parent_transform
+
+    ch_cx, ch_cy = int(ch_ext.get('cx')), int(ch_ext.get('cy'))
+    scale_x = int(ext.get('cx')) / ch_cx if ch_cx else 1.0
+    scale_y = int(ext.get('cy')) / ch_cy if ch_cy else 1.0
+    offset_x = int(off.get('x')) - int(ch_off.get('x')) * scale_x
+    offset_y = int(off.get('y')) - int(ch_off.get('y')) * scale_y
+
+    if parent_transform is not None:
+        parent_sx, parent_sy, parent_ox, parent_oy = parent_transform
+        scale_x, scale_y, offset_x, offset_y = (
+            parent_sx * scale_x,
+            parent_sy * scale_y,
+            parent_ox + parent_sx * offset_x,
+            parent_oy + parent_sy * offset_y,
+        )
+
+    if (scale_x, scale_y, offset_x, offset_y) == (1, 1, 0, 0):
+        return None
+    return (scale_x, scale_y, offset_x, offset_y)
+
+
 def get_center(item):
     """
     Get the center coordinates of a shape.
@@ -228,31 +497,220 @@ def match_rectangles_to_filenames(rectangles, filenames):
     Returns:
         list: List of matched pairs [(rect, filename_info), ...]
     """
+    return [(rectangles[i], filenames[j])
+            for i, j in match_rectangle_indices(rectangles, filenames)]
+
+
+def match_rectangle_indices(rectangles, filenames):
+    """
+    Match rectangles to filename text boxes, returning list indices.
+
+    The distance matrix is built with NumPy and solved with SciPy when
+    available; otherwise falls back to munkres. Both solve the same integer
+    cost matrix (see _tie_break_costs()), so equally distant candidates are
+    paired the same way whichever solver is installed.
+
+    Args:
+        rectangles: List of rectangle info
+        filenames: List of filename info
+
+    Returns:
+        list: List of matched index pairs [(rect_idx, filename_idx), ...]
+    """
     if not rectangles or not filenames:
         return []
 
+    try:
+        import numpy as np
+        cost_matrix = _tie_break_cost_matrix(_center_distance_matrix(rectangles, filenames))
+    except ImportError:
+        return _match_with_munkres(rectangles, filenames)
+
+    # SciPy solves in float64, which is exact only while total costs stay below 2**53
+    max_total = int(cost_matrix.max()) * min(len(rectangles), len(filenames))
+    if max_total >= 1 << 53:
+        return _match_with_munkres(rectangles, filenames, cost_matrix.tolist())
+
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        return _match_with_munkres(rectangles, filenames, cost_matrix.tolist())
+
+    # Find optimal assignment using Hungarian algorithm
+    row_indices, col_indices = linear_sum_assignment(cost_matrix.astype(np.float64))
+
+    return list(zip(row_indices.tolist(), col_indices.tolist()))
+
+
+def _center_distance_matrix(rectangles, filenames):
+    """
+    Calculate the distances between all rectangle and filename centers with NumPy.
+
+    Args:
+        rectangles: List of rectangle info
+        filenames: List of filename info
+
+    Returns:
+        numpy.ndarray: (len(rectangles), len(filenames)) distance matrix
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    import numpy as np
+
+    rc = np.fromiter((c for rect in rectangles for c in get_center(rect)),
+                     dtype=np.float64, count=2 * len(rectangles)).reshape(-1, 2)
+    fc = np.fromiter((c for fn in filenames for c in get_center(fn)),
+                     dtype=np.float64, count=2 * len(filenames)).reshape(-1, 2)
+    return np.sqrt(np.square(rc[:, None, :] - fc[None, :, :]).sum(-1))
+
+
+def _tie_break_cost_matrix(distances):
+    """
+    Convert a NumPy distance matrix into integer costs with a deterministic tie-break.
+
+    Vectorized equivalent of _tie_break_costs() (same values).
+
+    Args:
+        distances: numpy.ndarray distance matrix (EMU)
+
+    Returns:
+        numpy.ndarray: int64 cost matrix
+    """
+    import numpy as np
+
+    n_rows, n_cols = distances.shape
+    # Larger than the largest possible sum of tie-break terms
+    scale = min(n_rows, n_cols) * _TIE_BREAK_RANGE + 1
+
+    # SplitMix64 of the flat pair indices (uint64 arithmetic wraps modulo 2**64)
+    z = np.arange(n_rows * n_cols, dtype=np.uint64).reshape(n_rows, n_cols)
+    z += np.uint64(_SPLITMIX64_GAMMA)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_SPLITMIX64_MUL1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_SPLITMIX64_MUL2)
+    z ^= z >> np.uint64(31)
+    terms = (z >> np.uint64(64 - _TIE_BREAK_BITS)).astype(np.int64)
+
+    return np.rint(distances / _MATCH_DISTANCE_UNIT).astype(np.int64) * scale + terms
+
+
+def _tie_break_costs(distances):
+    """
+    Convert a distance matrix into integer costs with a deterministic tie-break.
+
+    Pure-Python version for installs without NumPy (see _tie_break_cost_matrix()).
+
+    Distances are rounded to 0.01 pt and scaled so that a smaller total
+    distance always wins. Assignments with the same rounded total are told
+    apart by a small fixed per-pair term derived from the indices, so the
+    optimum is (practically always) unique and every solver returns it.
+
+    Args:
+        distances: Distance matrix (list of lists, EMU)
+
+    Returns:
+        list: Integer cost matrix (list of lists)
+    """
+    n_rows = len(distances)
+    n_cols = len(distances[0])
+    # Larger than the largest possible sum of tie-break terms
+    scale = min(n_rows, n_cols) * _TIE_BREAK_RANGE + 1
+    return [[round(dist / _MATCH_DISTANCE_UNIT) * scale + _tie_break_term(i * n_cols + j)
+             for j, dist in enumerate(row)]
+            for i, row in enumerate(distances)]
+
+
+def _tie_break_term(pair_index):
+    """
+    Get the tie-break term of a (rectangle, filename) pair.
+
+    The pair's flat index (rect_idx * n_filenames + filename_idx) is hashed
+    with SplitMix64, a fixed bijective mixing function whose outputs are
+    statistically independent of their inputs, and the top _TIE_BREAK_BITS
+    bits are kept. A linear hash would not do: every full assignment covers
+    the same sum of indices, so linear terms would tie again. With mixed
+    terms two different assignments practically never have the same sum, and
+    the result is deterministic.
+
+    Args:
+        pair_index: Flat index of the pair in the cost matrix
+
+    Returns:
+        int: Tie-break term in [0, _TIE_BREAK_RANGE)
+    """
+    z = (pair_index + _SPLITMIX64_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * _SPLITMIX64_MUL1) & _MASK64
+    z = ((z ^ (z >> 27)) * _SPLITMIX64_MUL2) & _MASK64
+    z ^= z >> 31
+    return z >> (64 - _TIE_BREAK_BITS)
+
+
+def _match_with_munkres(rectangles, filenames, cost_matrix=None):
+    """
+    Match rectangles to filename text boxes using the munkres package.
+
+    Args:
+        rectangles: List of rectangle info
+        filenames: List of filename info
+        cost_matrix: Precomputed cost matrix from _tie_break_costs(), or None
+
+    Returns:
+        list: List of matched index pairs [(rect_idx, filename_idx), ...]
+    """
     from munkres import Munkres
 
     # Create cost matrix (distances between all pairs)
-    cost_matrix = []
-    for rect in rectangles:
-        row = []
-        for fn in filenames:
-            dist = calc_distance(rect, fn)
-            row.append(dist)
-        cost_matrix.append(row)
+    if cost_matrix is None:
+        distances = []
+        for rect in rectangles:
+            row = []
+            for fn in filenames:
+                dist = calc_distance(rect, fn)
+                row.append(dist)
+            distances.append(row)
+        cost_matrix = _tie_break_costs(distances)
 
     # Find optimal assignment using Hungarian algorithm
     m = Munkres()
-    indices = m.compute(cost_matrix)
+    return m.compute(cost_matrix)
+
+
+class PowerPointSession:
+    """
+    Context manager that keeps one PowerPoint COM connection open so that
+    several conversions can share it.
+
+    Usage:
+        with PowerPointSession() as app:
+            convert_pptx_to_pdf(pptx_path, pdf_path, app=app)
+    """
 
-    # Build matched pairs
-    matched = [(rectangles[i], filenames[j]) for i, j in indices]
+    def __init__(self):
+        self.app = None
 
-    return matched
+    def __enter__(self):
+        import pythoncom
+        import win32com.client
+
+        pythoncom.CoInitialize()
+        try:
+            self.app = win32com.client.Dispatch("PowerPoint.Application")
+        except Exception:
+            # __exit__ is not called when __enter__ fails
+            pythoncom.CoUninitialize()
+            raise
+        return self.app
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        import pythoncom
+
+        # Don't quit PowerPoint - user may have other files open
+        self.app = None
+        pythoncom.CoUninitialize()
+        return False
 
 
-def convert_pptx_to_pdf(pptx_path, pdf_path, embed_fonts=False):
+def convert_pptx_to_pdf(pptx_path, pdf_path, embed_fonts=False, app=None):
     """
     Convert PPTX to PDF using PowerPoint COM.
 
@@ -260,16 +718,19 @@ def convert_pptx_to_pdf(pptx_path, pdf_path, embed_fonts=False):
         pptx_path: Input PPTX file path
         pdf_path: Output PDF file path
         embed_fonts: True to force font embedding (PDF/A format)
+        app: PowerPoint Application from PowerPointSession
+             (if None, a connection is made for this call only)
     """
     import pythoncom
     import win32com.client
 
-    powerpoint = None
+    powerpoint = app
     presentation = None
 
     try:
-        pythoncom.CoInitialize()
-        powerpoint = win32com.client.Dispatch("PowerPoint.Application")
+        if app is None:
+            pythoncom.CoInitialize()
+            powerpoint = win32com.client.Dispatch("PowerPoint.Application")
 
         # Convert to absolute path
         pptx_abs = str(Path(pptx_path).resolve())
@@ -304,34 +765,129 @@ def convert_pptx_to_pdf(pptx_path, pdf_path, embed_fonts=False):
         if presentation:
             presentation.Close()
         # Don't quit PowerPoint - user may have other files open
-        pythoncom.CoUninitialize()
+        if app is None:
+            pythoncom.CoUninitialize()
+
+
+def convert_pptx_to_pdf_batch(pptx_paths, output_dir, embed_fonts=False):
+    """
+    Convert several PPTX files to PDF with a single LibreOffice run.
 
+    Args:
+        pptx_paths: Input PPTX file paths (file names must be unique)
+        output_dir: Output directory for the PDF files
+        embed_fonts: True to export as PDF/A
+
+    Returns:
+        list: Output PDF file paths (same order as pptx_paths)
 
-def clip_region(input_pdf_path, output_path, page_num, rect, slide_width, slide_height, dpi=300):
+    Raises:
+        RuntimeError: If LibreOffice is not found or a file was not converted
+    """
+    soffice = shutil.which('soffice') or shutil.which('libreoffice')
+    if soffice is None:
+        raise RuntimeError("LibreOffice (soffice) not found")
+
+    export_filter = 'pdf:impress_pdf_Export'
+    if embed_fonts:
+        # PDF/A-1b
+        export_filter += ':{"SelectPdfVersion":{"type":"long","value":"1"}}'
+
+    subprocess.run(
+        [soffice, '--headless', '--convert-to', export_filter,
+         '--outdir', str(output_dir), *[str(p) for p in pptx_paths]],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    pdf_paths = [Path(output_dir) / (Path(p).stem + '.pdf') for p in pptx_paths]
+    for pptx_path, pdf_path in zip(pptx_paths, pdf_paths):
+        if not pdf_path.exists():
+            raise RuntimeError(f"LibreOffice failed to convert {Path(pptx_path).name}")
+
+    return pdf_paths
+
+
+def clip_region(input_pdf, output_path, page_num, rect, slide_width, slide_height, dpi=300,
+                vector=True, png_compress=None):
     """
     Clip a specific region from a PDF page.
 
     Args:
-        input_pdf_path: Input PDF file path
+        input_pdf: Input PDF file path, or an already opened fitz.Document
+                   (left open for the caller to reuse)
         output_path: Output file path (.pdf, .png, .svg)
         page_num: Page number (0-indexed)
         rect: Clipping region {left, top, width, height} (in EMU)
         slide_width: Slide width (in EMU)
         slide_height: Slide height (in EMU)
         dpi: Resolution for PNG output (default: 300)
+        vector: If False, PDF output is rasterized at dpi instead of copying vector content
+        png_compress: zlib compression level (0-9) for PNG output, or None for MuPDF's default
     """
     import fitz  # PyMuPDF
 
-    doc = fitz.open(input_pdf_path)
+    if isinstance(input_pdf, fitz.Document):
+        doc = input_pdf
+        close_doc = False
+    else:
+        doc = fitz.open(input_pdf)
+        close_doc = True
+
+    try:
+        page, scales = get_page_with_scales(doc, page_num, slide_width, slide_height)
+        clip_page_region(page, scales, output_path, rect, dpi, vector, png_compress)
+    finally:
+        if close_doc:
+            doc.close()
+
+
+def get_page_with_scales(doc, page_num, slide_width, slide_height, page_cache=None):
+    """
+    Get a PDF page and its EMU-to-PDF scale factors.
+
+    Args:
+        doc: fitz.Document
+        page_num: Page number (0-indexed)
+        slide_width: Slide width (in EMU)
+        slide_height: Slide height (in EMU)
+        page_cache: Optional dict reused across calls (page_num -> result),
+                    so each page is loaded and measured only once
+
+    Returns:
+        tuple: (page, (scale_x, scale_y))
+    """
+    if page_cache is not None and page_num in page_cache:
+        return page_cache[page_num]
+
     page = doc[page_num]
 
-    # Get actual PDF page size
-    pdf_width = page.rect.width
-    pdf_height = page.rect.height
+    # Get actual PDF page size and convert EMU to PDF coordinates
+    page_rect = page.rect
+    scales = (page_rect.width / slide_width, page_rect.height / slide_height)
+
+    if page_cache is not None:
+        page_cache[page_num] = (page, scales)
+    return page, scales
+
+
+def clip_page_region(page, scales, output_path, rect, dpi=300, vector=True, png_compress=None):
+    """
+    Clip a specific region from a loaded PDF page.
+
+    Args:
+        page: fitz.Page
+        scales: (scale_x, scale_y) from get_page_with_scales()
+        output_path: Output file path (.pdf, .png, .svg)
+        rect: Clipping region {left, top, width, height} (in EMU)
+        dpi: Resolution for PNG output (default: 300)
+        vector: If False, PDF output is rasterized at dpi instead of copying vector content
+        png_compress: zlib compression level (0-9) for PNG output, or None for MuPDF's default
+    """
+    import fitz  # PyMuPDF
 
-    # Convert EMU to PDF coordinates
-    scale_x = pdf_width / slide_width
-    scale_y = pdf_height / slide_height
+    scale_x, scale_y = scales
 
     x0 = rect['left'] * scale_x
     y0 = rect['top'] * scale_y
@@ -350,19 +906,47 @@ def clip_region(input_pdf_path, output_path, page_num, rect, slide_width, slide_
         zoom = dpi / 72  # 72 DPI is the baseline
         mat = fitz.Matrix(zoom, zoom)
         pixmap = page.get_pixmap(matrix=mat, clip=clip_rect, alpha=True)
-        pixmap.save(output_path)
+        png_data = _pixmap_to_png(pixmap, png_compress)
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(png_data)
 
     elif ext == 'svg':
-        # Output as SVG (create a clipped PDF page first, then convert)
-        temp_doc = fitz.open()
-        try:
-            temp_page = temp_doc.new_page(width=clip_rect.width, height=clip_rect.height)
-            temp_page.show_pdf_page(temp_page.rect, doc, page_num, clip=clip_rect)
-            svg_content = temp_page.get_svg_image()
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-        finally:
-            temp_doc.close()
+        # Output as SVG (temporarily crop the page to the region, then convert)
+        svg_content = None
+        original_cropbox = page.cropbox
+        if page.rotation == 0 and original_cropbox == page.mediabox:
+            try:
+                page.set_cropbox(clip_rect)
+            except ValueError:
+                pass  # Region extends beyond the page
+            else:
+                try:
+                    svg_content = page.get_svg_image()
+                finally:
+                    page.set_cropbox(original_cropbox)
+
+        if svg_content is None:
+            # Fall back to a clipped copy of the page
+            temp_doc = fitz.open()
+            try:
+                temp_page = temp_doc.new_page(width=clip_rect.width, height=clip_rect.height)
+                temp_page.show_pdf_page(temp_page.rect, page.parent, page.number, clip=clip_rect)
+                svg_content = temp_page.get_svg_image()
+            finally:
+                temp_doc.close()
+
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(svg_content)
+
+    elif not vector:
+        # Output as PDF containing a rasterized image of the region
+        zoom = dpi / 72
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip_rect, alpha=True)
+        new_doc = fitz.open()
+        new_page = new_doc.new_page(width=clip_rect.width, height=clip_rect.height)
+        new_page.insert_image(new_page.rect, pixmap=pixmap)
+        new_doc.save(output_path, deflate=True)
+        new_doc.close()
 
     else:
         # Output as PDF
@@ -372,15 +956,80 @@ def clip_region(input_pdf_path, output_path, page_num, rect, slide_width, slide_
         # Copy clipping region from original page
         new_page.show_pdf_page(
             new_page.rect,
-            doc,
-            page_num,
+            page.parent,
+            page.number,
             clip=clip_rect
         )
 
         new_doc.save(output_path)
         new_doc.close()
 
-    doc.close()
+
+def _pixmap_to_png(pixmap, compress_level=None):
+    """
+    Encode a pixmap as PNG.
+
+    Uses MuPDF's encoder by default. With compress_level, the image is
+    encoded with Pillow at that zlib level instead (falls back to MuPDF
+    if Pillow is not installed).
+
+    Args:
+        pixmap: fitz.Pixmap
+        compress_level: zlib compression level (0-9), or None
+
+    Returns:
+        bytes: PNG data
+    """
+    if compress_level is not None:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+
+        # MuPDF pixmaps with alpha are premultiplied ('La'/'RGBa' in Pillow)
+        modes = {1: ('L', 'L'), 2: ('La', 'LA'), 3: ('RGB', 'RGB'), 4: ('RGBa', 'RGBA')}
+        if Image is not None and pixmap.n in modes:
+            raw_mode, mode = modes[pixmap.n]
+            img = Image.frombytes(raw_mode, (pixmap.width, pixmap.height), pixmap.samples)
+            if raw_mode != mode:
+                img = img.convert(mode)
+            buf = io.BytesIO()
+            img.save(buf, format='PNG', compress_level=compress_level,
+                     dpi=(pixmap.xres, pixmap.yres))
+            return buf.getvalue()
+
+    return pixmap.tobytes(output='png')
+
+
+def _clip_slide_regions(input_pdf_path, tasks, slide_width, slide_height, dpi=300, vector=True,
+                        png_compress=None):
+    """
+    Clip several regions from a PDF (worker process entry point).
+
+    Args:
+        input_pdf_path: Input PDF file path
+        tasks: List of (output_path, page_num, rect) tuples
+        slide_width: Slide width (in EMU)
+        slide_height: Slide height (in EMU)
+        dpi: Resolution for PNG output (default: 300)
+        vector: If False, PDF output is rasterized
+        png_compress: zlib compression level for PNG output, or None
+
+    Returns:
+        int: Number of regions clipped
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(input_pdf_path)
+    try:
+        page_cache = {}
+        for output_path, page_num, rect in tasks:
+            page, scales = get_page_with_scales(doc, page_num, slide_width, slide_height, page_cache)
+            clip_page_region(page, scales, output_path, rect, dpi, vector, png_compress)
+    finally:
+        doc.close()
+
+    return len(tasks)
 
 
 def remove_shape(shape):
@@ -394,6 +1043,28 @@ def remove_shape(shape):
     sp.getparent().remove(sp)
 
 
+def remove_shapes(shapes):
+    """
+    Remove several shapes at once.
+
+    Shapes are grouped by their parent element and removed from the last
+    child to the first. Shapes listed more than once are removed only once.
+
+    Args:
+        shapes: Shapes to remove
+    """
+    children_by_parent = {}
+    for shape in shapes:
+        sp = shape._element
+        parent = sp.getparent()
+        if parent is not None:
+            children_by_parent.setdefault(parent, set()).add(sp)
+
+    for parent, children in children_by_parent.items():
+        for sp in sorted(children, key=parent.index, reverse=True):
+            parent.remove(sp)
+
+
 def clear_slide_background(slide):
     """
     Clear slide background (set to no fill).
@@ -406,13 +1077,121 @@ def clear_slide_background(slide):
     fill.background()  # Set to inherit (no explicit fill)
 
 
-def scan_pptx(pptx_path, marker_color=(0, 255, 255)):
+def _remove_markers(prs, shapes_to_remove, include_background=False):
+    """
+    Remove marker rectangles and filename text boxes from a presentation.
+
+    Args:
+        prs: python-pptx Presentation object
+        shapes_to_remove: List of shapes to remove (from scan_pptx)
+        include_background: If False, also clear slide backgrounds
+    """
+    # Remove marker rectangles and filename text boxes
+    remove_shapes(shapes_to_remove)
+
+    # Clear slide backgrounds by default (unless include_background is True)
+    if not include_background:
+        for slide in prs.slides:
+            clear_slide_background(slide)
+
+
+def _scan_slide(slide_idx, slide, target_rgb, base_name):
+    """
+    Collect clipping information from a single slide.
+
+    Args:
+        slide_idx: Slide index (0-indexed)
+        slide: python-pptx Slide object
+        target_rgb: Marker rectangle color (R, G, B) tuple
+        base_name: Base name used for default output filenames
+
+    Returns:
+        tuple: (clip_entries, shapes_to_remove)
+    """
+    clip_entries = []
+    shapes_to_remove = []
+
+    rectangles, filenames = _scan_slide_shapes(slide, target_rgb)
+
+    if not rectangles:
+        return clip_entries, shapes_to_remove
+
+    # Match rectangles to filenames based on distance
+    matched_indices = match_rectangle_indices(rectangles, filenames)
+
+    # Track which rectangles were matched
+    is_matched = [False] * len(rectangles)
+
+    # Process matched rectangles
+    for rect_idx, filename_idx in matched_indices:
+        rect = rectangles[rect_idx]
+        filename_info = filenames[filename_idx]
+        is_matched[rect_idx] = True
+
+        clip_entries.append({
+            'slide_idx': slide_idx,
+            'rect': {
+                'left': rect['left'],
+                'top': rect['top'],
+                'width': rect['width'],
+                'height': rect['height'],
+            },
+            'filename': filename_info['filename'],
+        })
+
+        shapes_to_remove.append(rect['shape'])
+        shapes_to_remove.append(filename_info['shape'])
+
+    # Assign default names to unmatched rectangles
+    unmatched_idx = 0
+    for rect, matched in zip(rectangles, is_matched):
+        if not matched:
+            unmatched_idx += 1
+            default_filename = f"{base_name}_s{slide_idx + 1}_{len(matched_indices) + unmatched_idx}.pdf"
+            clip_entries.append({
+                'slide_idx': slide_idx,
+                'rect': {
+                    'left': rect['left'],
+                    'top': rect['top'],
+                    'width': rect['width'],
+                    'height': rect['height'],
+                },
+                'filename': default_filename,
+            })
+            shapes_to_remove.append(rect['shape'])
+
+    return clip_entries, shapes_to_remove
+
+
+def _open_presentation(pptx_source):
+    """
+    Load a presentation from a file path or a binary file object.
+
+    Args:
+        pptx_source: PPTX file path, or file object (e.g. io.BytesIO)
+
+    Returns:
+        Presentation object
+    """
+    if hasattr(pptx_source, 'read'):
+        return Presentation(pptx_source)
+
+    with open(pptx_source, 'rb', buffering=_PPTX_IO_BUFFER_SIZE) as f:
+        return Presentation(f)
+
+
+def scan_pptx(pptx_source, marker_color=(0, 255, 255), base_name=None):
     """
     Scan a PPTX file to get clipping information.
 
+    Slides are scanned concurrently; results are collected in slide order
+    so output filenames stay deterministic.
+
     Args:
-        pptx_path: Input PPTX file path
+        pptx_source: Input PPTX file path, or file object (e.g. io.BytesIO)
         marker_color: Marker rectangle color (R, G, B) tuple
+        base_name: Base name for default output filenames
+                   (default: file name stem of pptx_source, or 'presentation')
 
     Returns:
         dict: {
@@ -420,80 +1199,339 @@ def scan_pptx(pptx_path, marker_color=(0, 255, 255)):
             'slide_height': Slide height,
             'clip_info': List of clipping info,
             'shapes_to_remove': List of shapes to remove,
+            'shape_refs': (slide_idx, shape_id) of each shape to remove,
             'presentation': Presentation object
         }
     """
-    pptx_path = Path(pptx_path)
-    base_name = pptx_path.stem
+    if base_name is None:
+        if hasattr(pptx_source, 'read'):
+            base_name = Path(getattr(pptx_source, 'name', 'presentation')).stem
+        else:
+            base_name = Path(pptx_source).stem
 
     # Load PPTX
-    prs = Presentation(str(pptx_path))
+    prs = _open_presentation(pptx_source)
     slide_width = prs.slide_width
     slide_height = prs.slide_height
 
     # Collect clipping info from each slide
     clip_info = []
     shapes_to_remove = []
+    shape_refs = []
 
-    for slide_idx, slide in enumerate(prs.slides):
-        rectangles = find_marker_rectangles(slide, marker_color)
-        filenames = find_filename_textboxes(slide)
-
-        if not rectangles:
-            continue
+    slides = list(prs.slides)
+    if slides:
+        with ThreadPoolExecutor(max_workers=min(8, len(slides))) as executor:
+            results = list(executor.map(
+                lambda item: _scan_slide(item[0], item[1], marker_color, base_name),
+                enumerate(slides)
+            ))
 
-        # Match rectangles to filenames based on distance
-        matched_pairs = match_rectangles_to_filenames(rectangles, filenames)
-
-        # Record IDs of matched rectangles
-        matched_rect_ids = {id(rect) for rect, _ in matched_pairs}
-
-        # Process matched rectangles
-        for rect, filename_info in matched_pairs:
-            clip_info.append({
-                'slide_idx': slide_idx,
-                'rect': {
-                    'left': rect['left'],
-                    'top': rect['top'],
-                    'width': rect['width'],
-                    'height': rect['height'],
-                },
-                'filename': filename_info['filename'],
-            })
-
-            shapes_to_remove.append(rect['shape'])
-            shapes_to_remove.append(filename_info['shape'])
-
-        # Assign default names to unmatched rectangles
-        unmatched_idx = 0
-        for rect in rectangles:
-            if id(rect) not in matched_rect_ids:
-                unmatched_idx += 1
-                default_filename = f"{base_name}_s{slide_idx + 1}_{len(matched_pairs) + unmatched_idx}.pdf"
-                clip_info.append({
-                    'slide_idx': slide_idx,
-                    'rect': {
-                        'left': rect['left'],
-                        'top': rect['top'],
-                        'width': rect['width'],
-                        'height': rect['height'],
-                    },
-                    'filename': default_filename,
-                })
-                shapes_to_remove.append(rect['shape'])
+        for slide_idx, (slide_clips, slide_shapes) in enumerate(results):
+            clip_info.extend(slide_clips)
+            shapes_to_remove.extend(slide_shapes)
+            shape_refs.extend((slide_idx, shape.shape_id) for shape in slide_shapes)
 
     return {
         'slide_width': slide_width,
         'slide_height': slide_height,
         'clip_info': clip_info,
         'shapes_to_remove': shapes_to_remove,
+        'shape_refs': shape_refs,
         'presentation': prs,
     }
 
 
+def _scan_cache_key(pptx_path, marker_color):
+    """
+    Build the cache key of a PPTX file (changes when the file or color changes).
+
+    Args:
+        pptx_path: Input PPTX file path (Path)
+        marker_color: Marker rectangle color (R, G, B) tuple
+
+    Returns:
+        str: Cache key
+    """
+    stat = pptx_path.stat()
+    r, g, b = marker_color
+    return f"v{_SCAN_CACHE_VERSION}:{stat.st_mtime_ns}:{stat.st_size}:{r},{g},{b}"
+
+
+def _load_scan_cache(cache_path):
+    """
+    Load the scan cache, returning an empty cache if missing or unreadable.
+
+    Args:
+        cache_path: Cache file path (Path)
+
+    Returns:
+        dict: {resolved PPTX path: {'key': cache key, 'plan': scan plan}}
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_scan_cache(cache_path, entry_name, entry, lock_timeout=2.0):
+    """
+    Store one entry in the scan cache (errors are ignored; the cache is only an optimization).
+
+    Concurrent writers (e.g. GUI workers sharing an output directory) are
+    serialized with a lock file; the cache is re-read under the lock so their
+    entries are kept, and replaced atomically so readers never see a
+    partially written file. If the lock cannot be taken in time, the entry
+    is not saved.
+
+    Args:
+        cache_path: Cache file path (Path)
+        entry_name: Resolved PPTX path
+        entry: {'key': cache key, 'plan': scan plan}
+        lock_timeout: Seconds to wait for the lock file
+    """
+    lock_path = cache_path.with_name(cache_path.name + '.lock')
+    deadline = time.monotonic() + lock_timeout
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            break
+        except FileExistsError:
+            # Remove a lock left behind by a crashed writer
+            try:
+                if time.time() - os.path.getmtime(lock_path) > _SCAN_CACHE_STALE_LOCK:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                return
+            time.sleep(0.01)
+        except OSError:
+            return
+
+    temp_path = None
+    try:
+        cache = _load_scan_cache(cache_path)
+        cache[entry_name] = entry
+        fd, temp_path = tempfile.mkstemp(prefix=cache_path.name, suffix='.tmp',
+                                         dir=cache_path.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        # mkstemp creates 0600 files; use the umask default like any other output
+        # (the lock file was created with mode 0666 minus the umask)
+        os.chmod(temp_path, os.stat(lock_path).st_mode & 0o777)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+    except OSError:
+        pass
+    finally:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def _scan_plan(scan_result):
+    """
+    Convert a scan result into JSON-serializable form for the scan cache.
+
+    Args:
+        scan_result: Result of scan_pptx()
+
+    Returns:
+        dict: Scan plan
+    """
+    return {
+        'slide_width': int(scan_result['slide_width']),
+        'slide_height': int(scan_result['slide_height']),
+        'clip_info': [
+            {
+                'slide_idx': info['slide_idx'],
+                'rect': {key: int(value) for key, value in info['rect'].items()},
+                'filename': info['filename'],
+            }
+            for info in scan_result['clip_info']
+        ],
+        'shape_refs': [list(ref) for ref in scan_result['shape_refs']],
+    }
+
+
+def _scan_result_from_plan(pptx_source, plan, load_presentation=True):
+    """
+    Rebuild a scan_pptx() result from a cached scan plan without searching the slides.
+
+    Args:
+        pptx_source: Input PPTX file path, or file object
+        plan: Scan plan from _scan_plan()
+        load_presentation: If False, skip loading the PPTX
+                           ('presentation' is None, 'shapes_to_remove' empty)
+
+    Returns:
+        dict: Same form as scan_pptx(), or None if the plan does not fit the file
+    """
+    try:
+        shape_refs = [(int(slide_idx), int(shape_id)) for slide_idx, shape_id in plan['shape_refs']]
+        scan_result = {
+            'slide_width': plan['slide_width'],
+            'slide_height': plan['slide_height'],
+            'clip_info': [
+                {
+                    'slide_idx': info['slide_idx'],
+                    'rect': dict(info['rect']),
+                    'filename': info['filename'],
+                }
+                for info in plan['clip_info']
+            ],
+            'shapes_to_remove': [],
+            'shape_refs': shape_refs,
+            'presentation': None,
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if not load_presentation:
+        return scan_result
+
+    prs = _open_presentation(pptx_source)
+
+    # Look up the shapes to remove by their IDs
+    ids_by_slide = {}
+    for slide_idx, shape_id in shape_refs:
+        ids_by_slide.setdefault(slide_idx, set()).add(shape_id)
+
+    slides = list(prs.slides)
+    shapes_to_remove = []
+    for slide_idx, shape_ids in ids_by_slide.items():
+        if slide_idx >= len(slides):
+            return None
+        shapes = slides[slide_idx].shapes
+        for element, _ in _iter_shape_elements(shapes._spTree):
+            if element.shape_id in shape_ids:
+                shapes_to_remove.append(shapes._shape_factory(element))
+
+    if len(shapes_to_remove) != len(set(shape_refs)):
+        return None
+
+    scan_result['shapes_to_remove'] = shapes_to_remove
+    scan_result['presentation'] = prs
+    return scan_result
+
+
+def _scan_with_cache(pptx_path, pptx_data, output_dir, marker_color, use_cache=True,
+                     load_presentation=True, update_cache=True):
+    """
+    Scan a PPTX file, or reuse the cached result of an unchanged file.
+
+    Args:
+        pptx_path: Input PPTX file path (Path)
+        pptx_data: Contents of the PPTX file (bytes)
+        output_dir: Output directory holding the scan cache (Path)
+        marker_color: Marker rectangle color (R, G, B) tuple
+        use_cache: If False, always scan (and do not update the cache)
+        load_presentation: If False, a cached result may omit the presentation
+                           and the shapes to remove
+        update_cache: If False, only read the cache (nothing is written to output_dir)
+
+    Returns:
+        dict: Scan result (see scan_pptx())
+    """
+    cache_path = output_dir / SCAN_CACHE_FILENAME
+    cache_entry_name = str(pptx_path.resolve())
+    cache_key = _scan_cache_key(pptx_path, marker_color)
+
+    if use_cache:
+        cached = _load_scan_cache(cache_path).get(cache_entry_name)
+        if isinstance(cached, dict) and cached.get('key') == cache_key:
+            scan_result = _scan_result_from_plan(io.BytesIO(pptx_data), cached.get('plan') or {},
+                                                 load_presentation=load_presentation)
+            if scan_result is not None:
+                return scan_result
+
+    scan_result = scan_pptx(io.BytesIO(pptx_data), marker_color, base_name=pptx_path.stem)
+    if use_cache and update_cache:
+        _save_scan_cache(cache_path, cache_entry_name,
+                         {'key': cache_key, 'plan': _scan_plan(scan_result)})
+    return scan_result
+
+
+def confirm_overwrite(clip_info, output_dir):
+    """
+    Ask before overwriting existing output files.
+
+    Args:
+        clip_info: List of clipping info
+        output_dir: Output directory path
+
+    Returns:
+        bool: True if no output exists yet or the user confirmed overwriting
+    """
+    output_dir = Path(output_dir)
+    existing_files = []
+    for info in clip_info:
+        output_path = output_dir / info['filename']
+        if output_path.exists():
+            existing_files.append(output_path)
+
+    if existing_files:
+        print("The following files already exist:")
+        for f in existing_files:
+            print(f"  - {f}")
+        response = input("Overwrite? [y/N]: ").strip().lower()
+        if response != 'y':
+            print("Aborted.")
+            return False
+    return True
+
+
+def prepare_pptx(pptx_path, output_pptx_path, marker_color=(0, 255, 255), include_background=False,
+                 output_dir=None, use_cache=True):
+    """
+    Save a copy of a PPTX file with markers removed, ready for PDF conversion.
+
+    Used for batch conversion: the prepared copies are converted together
+    and passed back to process_pptx() via pre_converted_pdf.
+
+    Args:
+        pptx_path: Input PPTX file path
+        output_pptx_path: Prepared PPTX file path
+        marker_color: Marker rectangle color (R, G, B) tuple
+        include_background: If True, keep slide backgrounds
+        output_dir: Output directory passed later to process_pptx(). If given, the
+                    scan result is stored in (or taken from) its scan cache so
+                    process_pptx() does not scan the file again
+        use_cache: If False, do not read or update the scan cache
+
+    Returns:
+        list: List of clipping info
+    """
+    pptx_path = Path(pptx_path)
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(pptx_path, 'rb', buffering=_PPTX_IO_BUFFER_SIZE) as f:
+            pptx_data = f.read()
+        scan_result = _scan_with_cache(pptx_path, pptx_data, output_dir, marker_color, use_cache)
+    else:
+        scan_result = scan_pptx(pptx_path, marker_color)
+    _remove_markers(scan_result['presentation'], scan_result['shapes_to_remove'], include_background)
+    with open(output_pptx_path, 'wb', buffering=_PPTX_IO_BUFFER_SIZE) as f:
+        scan_result['presentation'].save(f)
+    return scan_result['clip_info']
+
+
 def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255, 255),
                  dpi=300, margin=0, dry_run=False, quiet=False, no_overwrite=False,
-                 progress_callback=None, include_background=False):
+                 progress_callback=None, include_background=False, pre_converted_pdf=None,
+                 powerpoint_app=None, raster_pdf=False, use_cache=True, png_compress=None,
+                 clip_workers=1, convert_lock=None):
     """
     Process a PPTX file and output clipped PDFs.
 
@@ -502,7 +1540,7 @@ def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255,
         output_dir: Output directory path
         embed_fonts: True to force font embedding
         marker_color: Marker rectangle color (R, G, B) tuple
-        dpi: Resolution for PNG output
+        dpi: Resolution for PNG output (and rasterized PDF output)
         margin: Margin in points (positive: expand, negative: shrink)
         dry_run: If True, only show detection results
         quiet: If True, suppress output
@@ -510,6 +1548,18 @@ def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255,
         progress_callback: Progress callback function (message, current, total) -> bool
                           Returns False to cancel
         include_background: If True, include slide background in output
+        pre_converted_pdf: PDF already converted from the output of prepare_pptx().
+                           If given, the PPTX is only scanned and the PDF is clipped
+        powerpoint_app: PowerPoint Application from PowerPointSession to reuse
+        raster_pdf: If True, PDF figures are rasterized at dpi (faster, not vector)
+        use_cache: If True, reuse the scan result cached in the output directory
+                   while the PPTX file is unchanged
+        png_compress: zlib compression level (0-9) for PNG output, or None for MuPDF's default
+        clip_workers: Maximum processes used for clipping (1: in-process). Worker startup
+                      costs far more than clipping PDF/SVG regions, so more than one
+                      only pays off for many high-DPI PNG regions
+        convert_lock: Lock held while converting to PDF, to serialize PowerPoint
+                      automation between processes converting concurrently
 
     Returns:
         list: List of output files
@@ -527,15 +1577,19 @@ def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255,
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy to temp to avoid conflicts with open PowerPoint
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = make_temp_dir()
+    src_doc = None
 
     try:
-        temp_source_path = os.path.join(temp_dir, pptx_path.name)
-        shutil.copy2(str(pptx_path), temp_source_path)
+        # Read the PPTX into memory once (also avoids conflicts with open PowerPoint)
+        with open(pptx_path, 'rb', buffering=_PPTX_IO_BUFFER_SIZE) as f:
+            pptx_data = f.read()
+
+        # Scan, or reuse the cached result of an unchanged file
+        scan_result = _scan_with_cache(pptx_path, pptx_data, output_dir, marker_color, use_cache,
+                                       load_presentation=not pre_converted_pdf,
+                                       update_cache=not dry_run)
 
-        # Scan (using temp copy)
-        scan_result = scan_pptx(temp_source_path, marker_color)
         clip_info = scan_result['clip_info']
         shapes_to_remove = scan_result['shapes_to_remove']
         prs = scan_result['presentation']
@@ -564,45 +1618,86 @@ def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255,
             return [output_dir / info['filename'] for info in clip_info]
 
         # Check for existing files
-        if no_overwrite:
-            existing_files = []
-            for info in clip_info:
-                output_path = output_dir / info['filename']
-                if output_path.exists():
-                    existing_files.append(output_path)
-
-            if existing_files:
-                print("The following files already exist:")
-                for f in existing_files:
-                    print(f"  - {f}")
-                response = input("Overwrite? [y/N]: ").strip().lower()
-                if response != 'y':
-                    print("Aborted.")
-                    return []
-
-        # Remove marker rectangles and filename text boxes
-        for shape in shapes_to_remove:
-            remove_shape(shape)
-
-        # Clear slide backgrounds by default (unless include_background is True)
-        if not include_background:
-            for slide in prs.slides:
-                clear_slide_background(slide)
-
-        # Temporary PPTX and PDF paths (using same temp_dir)
-        temp_pptx_path = os.path.join(temp_dir, 'temp.pptx')
-        temp_pdf_path = os.path.join(temp_dir, 'temp.pdf')
-
-        # Save modified PPTX
-        prs.save(temp_pptx_path)
-
-        log(f"Converting {pptx_path.name} to PDF...")
-        if not progress(f"Converting {pptx_path.name} to PDF...", 0, len(clip_info)):
+        if no_overwrite and not confirm_overwrite(clip_info, output_dir):
             return []
 
-        convert_pptx_to_pdf(temp_pptx_path, temp_pdf_path, embed_fonts)
+        if pre_converted_pdf:
+            # Already converted from a copy prepared by prepare_pptx()
+            temp_pdf_path = str(pre_converted_pdf)
+        else:
+            # Remove markers and (optionally) slide backgrounds
+            _remove_markers(prs, shapes_to_remove, include_background)
+
+            # Temporary PPTX and PDF paths (using same temp_dir)
+            temp_pptx_path = os.path.join(temp_dir, 'temp.pptx')
+            temp_pdf_path = os.path.join(temp_dir, 'temp.pdf')
+
+            # Save modified PPTX
+            with open(temp_pptx_path, 'wb', buffering=_PPTX_IO_BUFFER_SIZE) as f:
+                prs.save(f)
+
+            log(f"Converting {pptx_path.name} to PDF...")
+            if not progress(f"Converting {pptx_path.name} to PDF...", 0, len(clip_info)):
+                return []
+
+            with convert_lock if convert_lock is not None else contextlib.nullcontext():
+                convert_pptx_to_pdf(temp_pptx_path, temp_pdf_path, embed_fonts, app=powerpoint_app)
+
+        # Group regions by slide so each worker renders whole pages. When several
+        # regions share a filename only the last one is rendered, matching the
+        # in-process order where later regions overwrite earlier ones
+        last_for_filename = {info['filename']: id(info) for info in clip_info}
+        slide_groups = {}
+        for info in clip_info:
+            if last_for_filename[info['filename']] == id(info):
+                slide_groups.setdefault(info['slide_idx'], []).append(info)
+
+        max_workers = min(len(slide_groups), clip_workers or 1)
+
+        if max_workers > 1:
+            # Render slides in parallel (PyMuPDF is not thread-safe, so use processes)
+            completed_ids = {id(info) for info in clip_info
+                             if last_for_filename[info['filename']] != id(info)}
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for infos in slide_groups.values():
+                    tasks = [(str(output_dir / info['filename']), info['slide_idx'], info['rect'])
+                             for info in infos]
+                    future = executor.submit(_clip_slide_regions, temp_pdf_path, tasks,
+                                             slide_width, slide_height, dpi, not raster_pdf,
+                                             png_compress)
+                    futures[future] = infos
+
+                cancelled = False
+                for future in as_completed(futures):
+                    future.result()
+                    for info in futures[future]:
+                        completed_ids.add(id(info))
+                        log(f"Clipping slide {info['slide_idx'] + 1} -> {info['filename']}")
+                        if not progress(f"Clipping {info['filename']}", len(completed_ids), len(clip_info)):
+                            cancelled = True
+                    if cancelled:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+            if cancelled:
+                # Leaving the pool waited for slides that were already being rendered;
+                # their files were written, so report them as well
+                for future, infos in futures.items():
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        completed_ids.update(id(info) for info in infos)
+
+            return [output_dir / info['filename'] for info in clip_info
+                    if last_for_filename[info['filename']] in completed_ids]
+
+        import fitz  # PyMuPDF
+
+        # Open the converted PDF once and reuse it for every region
+        src_doc = fitz.open(temp_pdf_path)
 
         output_files = []
+        page_cache = {}
 
         # Process each clipping region
         for i, info in enumerate(clip_info):
@@ -612,20 +1707,22 @@ def process_pptx(pptx_path, output_dir, embed_fonts=False, marker_color=(0, 255,
             if not progress(f"Clipping {info['filename']}", i + 1, len(clip_info)):
                 return output_files
 
-            clip_region(
-                temp_pdf_path,
-                str(output_path),
+            page, scales = get_page_with_scales(
+                src_doc,
                 info['slide_idx'],
-                info['rect'],
                 slide_width,
                 slide_height,
-                dpi
+                page_cache
             )
+            clip_page_region(page, scales, str(output_path), info['rect'], dpi, not raster_pdf,
+                             png_compress)
 
             output_files.append(output_path)
 
         return output_files
 
     finally:
+        if src_doc is not None:
+            src_doc.close()
         # Delete temporary files
         shutil.rmtree(temp_dir, ignore_errors=True)
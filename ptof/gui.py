@@ -4,9 +4,14 @@ PtoF - PPTX to Figures - GUI Interface
 Module providing GUI interface using CustomTkinter.
 """
 
+import multiprocessing
 import os
+import queue
+import re
 import sys
 import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 from tkinter import filedialog, messagebox, colorchooser
 
@@ -14,6 +19,19 @@ import customtkinter as ctk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 from .core import process_pptx, parse_color, COLOR_NAMES
+from ._worker import process_pptx_worker
+
+# HEX string of each preset color
+_COLOR_NAME_HEX = {name: f"#{r:02X}{g:02X}{b:02X}" for name, (r, g, b) in COLOR_NAMES.items()}
+
+# Maximum number of lines kept in the log textbox
+_LOG_MAX_LINES = 5000
+
+# Dropped paths containing spaces arrive wrapped in braces: {path1} {path2}
+_DROP_BRACE_RE = re.compile(r'\{([^}]+)\}')
+
+# Drops larger than this are checked against the filesystem off the UI thread
+_DROP_STAT_THREAD_THRESHOLD = 20
 
 
 def get_resource_path(relative_path):
@@ -53,10 +71,30 @@ class App(CTkDnD):
         # Variables
         self.input_files = []
         self.processing = False
+        self._ui_enabled = True
+
+        # Log messages and progress posted by the worker thread,
+        # applied in batches on the UI thread (see _drain_log_queue)
+        self._log_queue = queue.Queue()
+
+        # Last posted progress value and time, to throttle bar redraws
+        self._last_prog = -1.0
+        self._last_prog_ts = 0.0
+
+        # Last applied HEX input and its normalized color (matches the default)
+        self._last_color_key = "#00FFFF"
+        self._last_color_hex = "#00FFFF"
+
+        # Conversion jobs run one at a time on a single long-lived worker thread
+        self._job_queue = queue.Queue()
+        self._cancel_event = threading.Event()
 
         # Build UI
         self._create_widgets()
 
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+
     def _create_widgets(self):
         # Main frame
         self.main_frame = ctk.CTkFrame(self)
@@ -85,6 +123,12 @@ class App(CTkDnD):
         # Log section
         self._create_log_section()
 
+        # Widgets disabled while a conversion runs (options are added when built)
+        self._stateful_widgets = (
+            self.browse_btn, self.clear_btn, self.output_btn, self.output_entry,
+            self.dry_run_btn, self.convert_btn
+        )
+
     def _create_input_section(self):
         frame = ctk.CTkFrame(self.main_frame)
         frame.pack(fill="x", pady=(0, 10))
@@ -173,11 +217,11 @@ class App(CTkDnD):
         self.output_btn.pack(side="right", padx=(10, 0))
 
     def _create_options_section(self):
-        frame = ctk.CTkFrame(self.main_frame)
-        frame.pack(fill="x", pady=(0, 10))
+        self.options_frame = ctk.CTkFrame(self.main_frame)
+        self.options_frame.pack(fill="x", pady=(0, 10))
 
         # Header (click to expand/collapse)
-        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(self.options_frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=10, pady=(10, 5))
 
         self.options_expanded = False
@@ -194,96 +238,98 @@ class App(CTkDnD):
         )
         self.options_toggle_btn.pack(side="left")
 
-        # Options grid (initially hidden)
-        self.options_grid = ctk.CTkFrame(frame, fg_color="transparent")
-        # Not packed initially
+        # Option values (read at conversion time even if never expanded)
+        self.color_var = ctk.StringVar(value="cyan")
+        self.color_entry_var = ctk.StringVar(value="#00FFFF")
+        self.dpi_var = ctk.StringVar(value="300")
+        self.margin_var = ctk.StringVar(value="0")
+        self.embed_fonts_var = ctk.BooleanVar(value=False)
+        self.include_background_var = ctk.BooleanVar(value=False)
+
+        # Options grid (built on first expand, see _build_options_grid)
+        self.options_grid = None
 
-        # Color selection
-        color_frame = ctk.CTkFrame(self.options_grid, fg_color="transparent")
-        color_frame.pack(fill="x", pady=2)
+    def _build_options_grid(self):
+        """Create the option widgets"""
+        self.options_grid = ctk.CTkFrame(self.options_frame, fg_color="transparent")
+        self.options_grid.grid_columnconfigure(4, weight=1)
 
-        ctk.CTkLabel(color_frame, text="Marker Color:", width=120, anchor="w").pack(side="left")
+        # Color selection
+        ctk.CTkLabel(self.options_grid, text="Marker Color:", width=120, anchor="w").grid(
+            row=0, column=0, sticky="w", pady=2)
 
         # Preset selection
-        self.color_var = ctk.StringVar(value="cyan")
         self.color_menu = ctk.CTkOptionMenu(
-            color_frame,
+            self.options_grid,
             values=list(COLOR_NAMES.keys()),
             variable=self.color_var,
             command=self._on_color_preset_change,
             width=100
         )
-        self.color_menu.pack(side="left", padx=(10, 0))
+        self.color_menu.grid(row=0, column=1, sticky="w", padx=(10, 0), pady=2)
 
         # HEX input field
-        self.color_entry_var = ctk.StringVar(value="#00FFFF")
         self.color_entry = ctk.CTkEntry(
-            color_frame,
+            self.options_grid,
             textvariable=self.color_entry_var,
             width=80,
             placeholder_text="#RRGGBB"
         )
-        self.color_entry.pack(side="left", padx=(10, 0))
+        self.color_entry.grid(row=0, column=2, sticky="w", padx=(10, 0), pady=2)
         self.color_entry.bind("<Return>", self._on_color_entry_change)
         self.color_entry.bind("<FocusOut>", self._on_color_entry_change)
 
         # Color preview
         self.color_preview = ctk.CTkLabel(
-            color_frame,
+            self.options_grid,
             text="",
             width=30,
             height=30,
-            fg_color="#00FFFF",
+            fg_color=self._last_color_hex,
             corner_radius=5
         )
-        self.color_preview.pack(side="left", padx=(10, 0))
+        self.color_preview.grid(row=0, column=3, sticky="w", padx=(10, 0), pady=2)
 
         # Color picker button
         self.color_picker_btn = ctk.CTkButton(
-            color_frame,
+            self.options_grid,
             text="...",
             width=30,
             command=self._pick_color
         )
-        self.color_picker_btn.pack(side="left", padx=(5, 0))
+        self.color_picker_btn.grid(row=0, column=4, sticky="w", padx=(5, 0), pady=2)
 
         # DPI
-        dpi_frame = ctk.CTkFrame(self.options_grid, fg_color="transparent")
-        dpi_frame.pack(fill="x", pady=2)
-
-        ctk.CTkLabel(dpi_frame, text="DPI (for PNG):", width=120, anchor="w").pack(side="left")
-        self.dpi_var = ctk.StringVar(value="300")
-        self.dpi_entry = ctk.CTkEntry(dpi_frame, textvariable=self.dpi_var, width=150)
-        self.dpi_entry.pack(side="left", padx=(10, 0))
+        ctk.CTkLabel(self.options_grid, text="DPI (for PNG):", width=120, anchor="w").grid(
+            row=1, column=0, sticky="w", pady=2)
+        self.dpi_entry = ctk.CTkEntry(self.options_grid, textvariable=self.dpi_var, width=150)
+        self.dpi_entry.grid(row=1, column=1, columnspan=4, sticky="w", padx=(10, 0), pady=2)
 
         # Margin
-        margin_frame = ctk.CTkFrame(self.options_grid, fg_color="transparent")
-        margin_frame.pack(fill="x", pady=2)
-
-        ctk.CTkLabel(margin_frame, text="Margin (pt):", width=120, anchor="w").pack(side="left")
-        self.margin_var = ctk.StringVar(value="0")
-        self.margin_entry = ctk.CTkEntry(margin_frame, textvariable=self.margin_var, width=150)
-        self.margin_entry.pack(side="left", padx=(10, 0))
+        ctk.CTkLabel(self.options_grid, text="Margin (pt):", width=120, anchor="w").grid(
+            row=2, column=0, sticky="w", pady=2)
+        self.margin_entry = ctk.CTkEntry(self.options_grid, textvariable=self.margin_var, width=150)
+        self.margin_entry.grid(row=2, column=1, columnspan=4, sticky="w", padx=(10, 0), pady=2)
 
         # Checkboxes
-        checkbox_frame = ctk.CTkFrame(self.options_grid, fg_color="transparent")
-        checkbox_frame.pack(fill="x", pady=(10, 0))
-
-        self.embed_fonts_var = ctk.BooleanVar(value=False)
         self.embed_fonts_cb = ctk.CTkCheckBox(
-            checkbox_frame,
+            self.options_grid,
             text="Embed Fonts (PDF/A)",
             variable=self.embed_fonts_var
         )
-        self.embed_fonts_cb.pack(side="left", padx=(0, 20))
+        self.embed_fonts_cb.grid(row=3, column=0, columnspan=2, sticky="w", padx=(0, 20), pady=(10, 0))
 
-        self.include_background_var = ctk.BooleanVar(value=False)
         self.include_background_cb = ctk.CTkCheckBox(
-            checkbox_frame,
+            self.options_grid,
             text="Include Slide Background",
             variable=self.include_background_var
         )
-        self.include_background_cb.pack(side="left", padx=(0, 20))
+        self.include_background_cb.grid(row=3, column=2, columnspan=3, sticky="w", padx=(0, 20), pady=(10, 0))
+
+        self._option_widgets = (
+            self.color_menu, self.color_entry, self.color_picker_btn,
+            self.dpi_entry, self.margin_entry, self.embed_fonts_cb, self.include_background_cb
+        )
 
     def _create_action_section(self):
         frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -307,6 +353,17 @@ class App(CTkDnD):
         )
         self.convert_btn.pack(side="right")
 
+        self.cancel_btn = ctk.CTkButton(
+            frame,
+            text="Cancel",
+            width=80,
+            fg_color="gray",
+            hover_color="darkgray",
+            state="disabled",
+            command=self._cancel
+        )
+        self.cancel_btn.pack(side="right", padx=(0, 10))
+
         # Progress bar
         self.progress = ctk.CTkProgressBar(frame)
         self.progress.pack(side="left", fill="x", expand=True, padx=20)
@@ -329,6 +386,9 @@ class App(CTkDnD):
             self.options_toggle_btn.configure(text="▶ Options")
             self.options_expanded = False
         else:
+            if self.options_grid is None:
+                self._build_options_grid()
+                self._set_option_widgets_state("normal" if self._ui_enabled else "disabled")
             self.options_grid.pack(fill="x", padx=10, pady=(0, 10))
             self.options_toggle_btn.configure(text="▼ Options")
             self.options_expanded = True
@@ -344,7 +404,7 @@ class App(CTkDnD):
     def _set_input_files(self, files):
         """Set input files"""
         # Filter .pptx files only
-        pptx_files = [f for f in files if f.lower().endswith('.pptx')]
+        pptx_files = [f for f in files if os.path.splitext(f)[1].lower() == '.pptx']
         if pptx_files:
             self.input_files = pptx_files
             if len(self.input_files) == 1:
@@ -370,11 +430,22 @@ class App(CTkDnD):
     def _on_drop(self, event):
         """When files are dropped"""
         # Parse dropped file paths
-        files = self._parse_drop_data(event.data)
-        if files:
-            self._set_input_files(files)
+        candidates = self._parse_drop_data(event.data)
+        if len(candidates) > _DROP_STAT_THREAD_THRESHOLD:
+            # Stat large drops in the background so the drop handler returns fast
+            threading.Thread(target=self._check_dropped_files, args=(candidates,), daemon=True).start()
+        else:
+            files = [f for f in candidates if os.path.isfile(f)]
+            if files:
+                self._set_input_files(files)
         self._on_drag_leave(event)
 
+    def _check_dropped_files(self, candidates):
+        """Keep existing files from a large drop (runs in a worker thread)"""
+        files = [f for f in candidates if os.path.isfile(f)]
+        if files:
+            self.after(0, lambda: self._set_input_files(files))
+
     def _on_drag_enter(self, event):
         """When drag enters the zone"""
         self.drop_zone.configure(border_color=("#3B8ED0", "#1F6AA5"), fg_color=("gray85", "gray25"))
@@ -384,24 +455,18 @@ class App(CTkDnD):
         self.drop_zone.configure(border_color="gray", fg_color=("gray90", "gray20"))
 
     def _parse_drop_data(self, data):
-        """Convert drop data to list of file paths"""
-        files = []
+        """Convert drop data to list of candidate .pptx paths (not yet checked on disk)"""
         # On Windows, paths may be wrapped in {} or space-separated
         if '{' in data:
             # {path1} {path2} format
-            import re
-            files = re.findall(r'\{([^}]+)\}', data)
+            files = _DROP_BRACE_RE.findall(data)
         else:
             # Space-separated (for paths without spaces)
             files = data.split()
 
-        # Normalize paths
-        result = []
-        for f in files:
-            f = f.strip()
-            if f and os.path.isfile(f):
-                result.append(f)
-        return result
+        # Normalize paths and drop non-PPTX names before touching the filesystem
+        stripped = (f.strip() for f in files)
+        return [f for f in stripped if os.path.splitext(f)[1].lower() == '.pptx']
 
     def _browse_output(self):
         directory = filedialog.askdirectory(title="Select output directory")
@@ -410,32 +475,43 @@ class App(CTkDnD):
 
     def _on_color_preset_change(self, color_name):
         """Update preview and HEX input when preset color is selected"""
-        if color_name in COLOR_NAMES:
-            r, g, b = COLOR_NAMES[color_name]
-            hex_color = f"#{r:02X}{g:02X}{b:02X}"
+        hex_color = _COLOR_NAME_HEX.get(color_name)
+        if hex_color is None:
+            return
+        if hex_color != self._last_color_hex:
             self.color_preview.configure(fg_color=hex_color)
-            self.color_entry_var.set(hex_color)
-            self.color_var.set(color_name)
+        self.color_entry_var.set(hex_color)
+        self.color_var.set(color_name)
+        self._last_color_key = hex_color
+        self._last_color_hex = hex_color
 
     def _on_color_entry_change(self, event=None):
         """Update preview when HEX input field changes"""
         hex_value = self.color_entry_var.get().strip()
+        if hex_value == self._last_color_key:
+            return  # Unchanged since last Return/FocusOut
         try:
             rgb = parse_color(hex_value)
             hex_color = f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
             self.color_preview.configure(fg_color=hex_color)
             self.color_var.set(hex_value)  # Update internal variable
+            self._last_color_key = hex_value
+            self._last_color_hex = hex_color
         except ValueError:
             pass  # Ignore invalid colors
 
     def _pick_color(self):
         """Open color picker"""
         # Get current color
-        try:
-            current_rgb = parse_color(self.color_entry_var.get())
-            initial_color = f"#{current_rgb[0]:02X}{current_rgb[1]:02X}{current_rgb[2]:02X}"
-        except ValueError:
-            initial_color = "#00FFFF"
+        hex_value = self.color_entry_var.get().strip()
+        if hex_value == self._last_color_key:
+            initial_color = self._last_color_hex
+        else:
+            try:
+                current_rgb = parse_color(hex_value)
+                initial_color = f"#{current_rgb[0]:02X}{current_rgb[1]:02X}{current_rgb[2]:02X}"
+            except ValueError:
+                initial_color = "#00FFFF"
 
         color = colorchooser.askcolor(color=initial_color, title="Select Marker Color")
         if color[1]:  # color is a tuple ((R, G, B), "#RRGGBB")
@@ -443,29 +519,59 @@ class App(CTkDnD):
             self.color_var.set(hex_color)
             self.color_entry_var.set(hex_color)
             self.color_preview.configure(fg_color=hex_color)
-
-    def _log(self, message):
-        self.log_text.insert("end", message + "\n")
+            self._last_color_key = hex_color
+            self._last_color_hex = hex_color
+
+    def _log(self, lines):
+        """Append lines to the log, dropping the oldest beyond _LOG_MAX_LINES"""
+        self.log_text.insert("end", "\n".join(lines) + "\n")
+        # 'end-1c' sits on the empty line after the trailing newline
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        excess = line_count - _LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         self.log_text.see("end")
 
+    def _drain_log_queue(self):
+        """Apply queued log messages and progress from the worker thread"""
+        lines = []
+        last_progress = None
+        while True:
+            try:
+                kind, value = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                lines.append(value)
+            else:
+                last_progress = value
+
+        if lines:
+            self._log(lines)
+        if last_progress is not None:
+            self.progress.set(last_progress)
+
+        # Keep polling until the worker is done and everything is shown
+        if self.processing or not self._log_queue.empty():
+            self.after(50, self._drain_log_queue)
+
     def _clear_log(self):
         self.log_text.delete("1.0", "end")
 
     def _set_ui_state(self, enabled):
+        if enabled == self._ui_enabled:
+            return  # Avoid redrawing widgets that are already in this state
+        self._ui_enabled = enabled
         state = "normal" if enabled else "disabled"
-        self.browse_btn.configure(state=state)
-        self.clear_btn.configure(state=state)
-        self.output_btn.configure(state=state)
-        self.output_entry.configure(state=state)
-        self.color_menu.configure(state=state)
-        self.color_entry.configure(state=state)
-        self.color_picker_btn.configure(state=state)
-        self.dpi_entry.configure(state=state)
-        self.margin_entry.configure(state=state)
-        self.embed_fonts_cb.configure(state=state)
-        self.include_background_cb.configure(state=state)
-        self.dry_run_btn.configure(state=state)
-        self.convert_btn.configure(state=state)
+        for widget in self._stateful_widgets:
+            widget.configure(state=state)
+        if self.options_grid is not None:
+            self._set_option_widgets_state(state)
+        self.cancel_btn.configure(state="disabled" if enabled else "normal")
+
+    def _set_option_widgets_state(self, state):
+        for widget in self._option_widgets:
+            widget.configure(state=state)
 
     def _validate_inputs(self):
         if not self.input_files:
@@ -509,73 +615,159 @@ class App(CTkDnD):
         self._clear_log()
         self._set_ui_state(False)
         self.progress.set(0)
+        self._last_prog = -1.0
+        self._last_prog_ts = 0.0
         self.processing = True
-
-        # Run in background thread
-        thread = threading.Thread(target=self._process_files, args=(dry_run,))
-        thread.daemon = True
-        thread.start()
+        self.after(50, self._drain_log_queue)
+
+        # Hand the job to the worker thread
+        self._cancel_event.clear()
+        self._job_queue.put(dry_run)
+
+    def _cancel(self):
+        if self.processing and not self._cancel_event.is_set():
+            self._cancel_event.set()
+            self._log_queue.put(("log", "Cancelling..."))
+
+    def _worker_loop(self):
+        """Run queued conversion jobs (runs in the worker thread)"""
+        while True:
+            dry_run = self._job_queue.get()
+            self._process_files(dry_run)
+
+    def _post_progress(self, overall):
+        """Queue a progress update, at most ~30 per second or on a visible (1%) change"""
+        now = time.monotonic()
+        if overall - self._last_prog >= 0.01 or now - self._last_prog_ts > 0.033:
+            self._last_prog = overall
+            self._last_prog_ts = now
+            self._log_queue.put(("progress", overall))
 
     def _process_files(self, dry_run):
         try:
-            marker_color = parse_color(self.color_entry_var.get())
-            dpi = int(self.dpi_var.get())
-            margin = float(self.margin_var.get())
-            output_dir = self.output_var.get()
-            embed_fonts = self.embed_fonts_var.get()
-            include_background = self.include_background_var.get()
-
-            total_files = len(self.input_files)
-            all_output_files = []
-
-            for file_idx, pptx_file in enumerate(self.input_files):
-                self.after(0, lambda m=f"Processing: {Path(pptx_file).name}": self._log(m))
-
-                def progress_callback(msg, current, total):
-                    if total > 0:
-                        file_progress = file_idx / total_files
-                        item_progress = current / total / total_files
-                        overall = file_progress + item_progress
-                        self.after(0, lambda p=overall: self.progress.set(p))
-                    self.after(0, lambda m=f"  {msg}": self._log(m))
-                    return self.processing
-
-                try:
-                    output_files = process_pptx(
-                        pptx_file,
-                        output_dir,
-                        embed_fonts,
-                        marker_color,
-                        dpi,
-                        margin,
-                        dry_run,
-                        quiet=True,
-                        no_overwrite=False,
-                        progress_callback=progress_callback,
-                        include_background=include_background
-                    )
-                    all_output_files.extend(output_files)
-
-                except Exception as e:
-                    self.after(0, lambda m=f"Error: {e}": self._log(m))
+            kwargs = dict(
+                output_dir=self.output_var.get(),
+                embed_fonts=self.embed_fonts_var.get(),
+                marker_color=parse_color(self.color_entry_var.get()),
+                dpi=int(self.dpi_var.get()),
+                margin=float(self.margin_var.get()),
+                dry_run=dry_run,
+                quiet=True,
+                no_overwrite=False,
+                include_background=self.include_background_var.get()
+            )
+
+            if len(self.input_files) > 1 and not dry_run:
+                all_output_files = self._process_files_parallel(self.input_files, kwargs)
+            else:
+                all_output_files = self._process_files_serial(self.input_files, kwargs)
 
             # Completion
-            self.after(0, lambda: self.progress.set(1))
+            self._log_queue.put(("progress", 1))
             if dry_run:
-                self.after(0, lambda: self._log(f"\n[Dry-run] Would create {len(all_output_files)} file(s)"))
+                self._log_queue.put(("log", f"\n[Dry-run] Would create {len(all_output_files)} file(s)"))
             else:
-                self.after(0, lambda: self._log(f"\nSuccessfully created {len(all_output_files)} file(s)"))
+                self._log_queue.put(("log", f"\nSuccessfully created {len(all_output_files)} file(s)"))
 
             for f in all_output_files:
-                self.after(0, lambda m=f"  - {f}": self._log(m))
+                self._log_queue.put(("log", f"  - {f}"))
 
         except Exception as e:
-            self.after(0, lambda: self._log(f"Error: {e}"))
+            self._log_queue.put(("log", f"Error: {e}"))
 
         finally:
             self.processing = False
             self.after(0, lambda: self._set_ui_state(True))
 
+    def _process_files_serial(self, files, kwargs):
+        """Convert files one by one in this thread"""
+        total_files = len(files)
+        all_output_files = []
+
+        for file_idx, pptx_file in enumerate(files):
+            if self._cancel_event.is_set():
+                break
+            self._log_queue.put(("log", f"Processing: {Path(pptx_file).name}"))
+
+            def progress_callback(msg, current, total):
+                if total > 0:
+                    file_progress = file_idx / total_files
+                    item_progress = current / total / total_files
+                    self._post_progress(file_progress + item_progress)
+                self._log_queue.put(("log", f"  {msg}"))
+                return not self._cancel_event.is_set()
+
+            try:
+                output_files = process_pptx(pptx_file, progress_callback=progress_callback, **kwargs)
+                all_output_files.extend(output_files)
+
+            except Exception as e:
+                self._log_queue.put(("log", f"Error: {e}"))
+
+        return all_output_files
+
+    def _process_files_parallel(self, files, kwargs):
+        """Convert files concurrently, one worker process per file"""
+        total_files = len(files)
+        names = [Path(f).name for f in files]
+        fractions = [0.0] * total_files
+        all_output_files = []
+
+        # Each worker clips its own file in-process to avoid nested pools
+        kwargs = dict(kwargs, clip_workers=1)
+
+        with multiprocessing.Manager() as manager:
+            progress_queue = manager.Queue()
+            cancel_event = manager.Event()
+            # PowerPoint serializes automation calls and rejects calls from other
+            # clients while busy, so only one worker converts at a time; scanning
+            # and clipping still run in parallel
+            convert_lock = manager.Lock()
+            max_workers = min(total_files, os.cpu_count() or 1)
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for file_idx, pptx_file in enumerate(files):
+                    self._log_queue.put(("log", f"Processing: {names[file_idx]}"))
+                    future = executor.submit(process_pptx_worker, file_idx, pptx_file, kwargs,
+                                             progress_queue, cancel_event, convert_lock)
+                    futures[future] = file_idx
+
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+
+                    # Relay worker progress into the log queue
+                    updated = False
+                    while True:
+                        try:
+                            file_idx, msg, current, total = progress_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if total > 0:
+                            fractions[file_idx] = current / total
+                            updated = True
+                        self._log_queue.put(("log", f"  [{names[file_idx]}] {msg}"))
+                    if updated:
+                        self._post_progress(sum(fractions) / total_files)
+
+                    for future in done:
+                        if future.cancelled():
+                            continue
+                        file_idx = futures[future]
+                        try:
+                            all_output_files.extend(future.result())
+                        except Exception as e:
+                            self._log_queue.put(("log", f"Error ({names[file_idx]}): {e}"))
+
+                    if self._cancel_event.is_set() and not cancel_event.is_set():
+                        # Stop running workers and don't start the files still queued
+                        cancel_event.set()
+                        for future in pending:
+                            future.cancel()
+
+        return all_output_files
+
 
 def main():
     app = App()
@@ -3,7 +3,10 @@
 PtoF - PPTX to Figures - GUI Entry Point
 """
 
+import multiprocessing
+
 from ptof.gui import main
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Needed for the parallel clipping pool in frozen builds
     main()